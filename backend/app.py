@@ -29,7 +29,7 @@ logger = logging.getLogger(__name__)
 app = Flask(__name__, template_folder='../frontend')
 app.config.from_object(Config)
 CORS(app)
-socketio = SocketIO(app, cors_allowed_origins="*")
+socketio = SocketIO(app, cors_allowed_origins="*", async_mode='eventlet')
 
 # Global managers
 tts_manager = TTSManager()
@@ -9,6 +9,7 @@ from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
 import asyncio
 import aiohttp
+import httpx
 
 # TTS API imports
 import openai
@@ -53,29 +54,56 @@ class TTSService(ABC):
 class OpenAITTSService(TTSService):
     """OpenAI Text-to-Speech service implementation"""
     
-    def __init__(self, api_key: str, model: str = "tts-1-hd", voice: str = "alloy"):
+    def __init__(self, api_key: str, model: str = "tts-1-hd", voice: str = "alloy",
+                 http_client: Optional[httpx.AsyncClient] = None):
         self.api_key = api_key
         self.model = model
         self.voice = voice
         self.client = openai.OpenAI(api_key=api_key)
-        
+
+        # Shared async client used for synthesis when the caller injects an
+        # http_client: all requests then reuse one TCP+TLS connection pool
+        # instead of paying a handshake per chunk. The caller owns the
+        # injected client's lifetime and must keep it on one event loop.
+        # Without injection no client is kept, because a long-lived pool
+        # would bind to whichever loop first used it and break callers that
+        # run each chunk on a fresh loop (as backend.app does).
+        if http_client is not None:
+            self.async_client = openai.AsyncOpenAI(api_key=api_key, http_client=http_client)
+        else:
+            self.async_client = None
+
         # Rate limiting
         self.requests_per_minute = 50
         self.request_times = []
-    
+
     async def synthesize_speech(self, request: TTSRequest) -> TTSResponse:
         """Synthesize speech using OpenAI TTS"""
         try:
             # Rate limiting
             await self._wait_for_rate_limit()
-            
-            response = self.client.audio.speech.create(
-                model=request.model or self.model,
-                voice=request.voice or self.voice,
-                input=request.text,
-                speed=request.speed
-            )
-            
+
+            if self.async_client is not None:
+                response = await self.async_client.audio.speech.create(
+                    model=request.model or self.model,
+                    voice=request.voice or self.voice,
+                    input=request.text,
+                    speed=request.speed
+                )
+            else:
+                # Per-call client so the connection pool never outlives the
+                # event loop this coroutine happens to be running on
+                client = openai.AsyncOpenAI(api_key=self.api_key)
+                try:
+                    response = await client.audio.speech.create(
+                        model=request.model or self.model,
+                        voice=request.voice or self.voice,
+                        input=request.text,
+                        speed=request.speed
+                    )
+                finally:
+                    await client.close()
+
             audio_data = response.content
             
             return TTSResponse(
@@ -40,15 +40,27 @@ class Config:
     SKIP_INDEX = True
     SKIP_BIBLIOGRAPHY = True
     
+    # Cached validation result; config is immutable within a process
+    _validation_cache = None
+
     @classmethod
     def validate_config(cls):
         """Validate that required configuration is present"""
+        if cls._validation_cache is not None:
+            return cls._validation_cache
+
         errors = []
-        
+
         if not cls.OPENAI_API_KEY:
             errors.append("OPENAI_API_KEY environment variable is required")
-            
+
         if not cls.GOOGLE_CLOUD_CREDENTIALS:
             errors.append("GOOGLE_CLOUD_CREDENTIALS environment variable is required")
-            
+
+        cls._validation_cache = errors
         return errors
+
+    @classmethod
+    def invalidate_cache(cls):
+        """Clear the cached validation result (e.g. after mutating env in tests)"""
+        cls._validation_cache = None
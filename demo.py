@@ -5,16 +5,77 @@ Demonstrates core functionality without the web interface
 """
 
 import os
+import re
 import asyncio
+import hashlib
+import subprocess
 from pathlib import Path
+from typing import NamedTuple
+
+import aiofiles
+import httpx
+from pydub import AudioSegment
+
+# Use uvloop's faster event loop when available (not on Windows)
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
 
 # Import our modules
 from backend.pdf_processor import PDFProcessor
 from backend.content_filter import ContentFilter
-from backend.tts_services import TTSManager, OpenAITTSService
-from backend.audio_processor import AudioProcessor, AudioMetadata, AudioChunk
+from backend.tts_services import TTSManager, OpenAITTSService, TTSResponse
+from backend.audio_processor import AudioProcessor, AudioMetadata
 from config.config import Config
 
+# On-disk cache for synthesized speech, keyed by (text, voice, model, speed)
+TTS_CACHE_DIR = Path("output/tts_cache")
+
+# Matches section headers (chapters and skippable front/back matter) so the
+# text can be segmented and classified in a single linear scan
+_CHAPTER_RE = re.compile(r'(?i)^(Chapter\s+\d+|Acknowledgments|Index|Bibliography)', re.M)
+
+
+class ChunkMeta(NamedTuple):
+    """Transient per-chunk metadata; far lighter than a dict at book scale"""
+    text: str
+    chapter: str
+
+
+def tts_cache_key(text: str, voice: str, model: str, speed: float) -> str:
+    """Compute a content-addressed cache key for a TTS request"""
+    payload = repr((text, voice, model, speed)).encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+async def cached_synthesize(tts_manager, text: str, voice: str = "alloy",
+                            speed: float = 1.0) -> TTSResponse:
+    """Synthesize speech, reusing cached audio for previously seen requests"""
+    # Key on the model the service is actually configured with, so a cache
+    # entry can never be served for audio synthesized by a different model
+    model = tts_manager.services["openai"].model
+    cache_path = TTS_CACHE_DIR / f"{tts_cache_key(text, voice, model, speed)}.mp3"
+
+    if cache_path.exists():
+        async with aiofiles.open(cache_path, 'rb') as f:
+            audio_data = await f.read()
+        return TTSResponse(audio_data=audio_data, format="mp3")
+
+    response = await tts_manager.synthesize_speech(
+        text,
+        service_name="openai",
+        voice=voice,
+        speed=speed
+    )
+
+    if not response.error:
+        async with aiofiles.open(cache_path, 'wb') as f:
+            await f.write(response.audio_data)
+
+    return response
+
 def create_sample_pdf_text():
     """Create a sample text that simulates PDF content"""
     return """
@@ -43,7 +104,7 @@ C - Chapter, 45
 This index section would also be filtered out automatically.
 """
 
-async def demo_conversion():
+async def demo_conversion(http_client: httpx.AsyncClient):
     """Demonstrate the conversion process"""
     print("🎧 Podcastify Demo")
     print("=" * 20)
@@ -67,7 +128,8 @@ async def demo_conversion():
     openai_service = OpenAITTSService(
         api_key=Config.OPENAI_API_KEY,
         model="tts-1",  # Use faster model for demo
-        voice="alloy"
+        voice="alloy",
+        http_client=http_client  # Reuse one connection pool across all chunks
     )
     tts_manager.add_service("openai", openai_service)
     
@@ -80,15 +142,16 @@ async def demo_conversion():
     # Simulate content filtering
     print("🔍 Applying content filters...")
     
-    # Split into sections (simulate chapter detection)
-    sections = sample_text.split("Chapter")
+    # Split into sections (simulate chapter detection) in one pass:
+    # each header match both segments the text and classifies the section
+    matches = list(_CHAPTER_RE.finditer(sample_text))
     filtered_sections = []
-    
-    for i, section in enumerate(sections):
-        if section.strip() and not any(keyword in section.lower() for keyword in 
-                                     ['acknowledgments', 'index', 'bibliography']):
-            if i > 0:  # Skip empty first section
-                filtered_sections.append(f"Chapter{section}")
+
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(sample_text)
+        header = match.group(1)
+        if header[:7].lower() == "chapter":
+            filtered_sections.append(sample_text[match.start():end].strip())
     
     print(f"✅ Filtered to {len(filtered_sections)} main sections")
     
@@ -96,69 +159,122 @@ async def demo_conversion():
     print("\n✂️ Chunking text for TTS...")
     all_chunks = []
     
-    for section in filtered_sections:
+    for chapter_idx, section in enumerate(filtered_sections, start=1):
         chunks = pdf_processor.chunk_text_for_tts(section, 500)  # Smaller chunks for demo
         for chunk in chunks:
-            all_chunks.append({
-                'text': chunk,
-                'chapter': f"Chapter {len(all_chunks) // 2 + 1}"
-            })
+            all_chunks.append(ChunkMeta(text=chunk, chapter=f"Chapter {chapter_idx}"))
     
     print(f"✅ Created {len(all_chunks)} text chunks")
     
-    # Convert to speech
+    # Convert to speech (chunks are synthesized concurrently, bounded by a
+    # semaphore) and spooled to disk as they complete, so file writing
+    # overlaps the TTS critical path instead of waiting for it.
     print("\n🎵 Converting to speech...")
-    audio_chunks = []
-    
-    for i, chunk in enumerate(all_chunks):
-        print(f"   Processing chunk {i+1}/{len(all_chunks)}")
-        
-        response = await tts_manager.synthesize_speech(
-            chunk['text'],
-            service_name="openai",
-            voice="alloy",
-            speed=1.0
-        )
-        
-        if response.error:
-            print(f"❌ TTS error: {response.error}")
-            return
-        
-        audio_chunks.append(AudioChunk(
-            audio_data=response.audio_data,
-            text=chunk['text'],
-            chapter=chunk['chapter']
-        ))
-    
+    semaphore = asyncio.Semaphore(8)
+    queue = asyncio.Queue(maxsize=8)
+    chapter_pause_duration = 1.0  # Shorter pause for demo
+
+    chunk_dir = Path("output/demo_chunks")
+    chunk_dir.mkdir(parents=True, exist_ok=True)
+
+    async def synthesize_chunk(index, chunk):
+        async with semaphore:
+            try:
+                response = await cached_synthesize(
+                    tts_manager,
+                    chunk.text,
+                    voice="alloy",
+                    speed=1.0
+                )
+            except Exception as e:
+                response = TTSResponse(audio_data=b"", format="mp3", error=str(e))
+        return index, response
+
+    async def producer():
+        """Feed synthesized chunks into the queue as they complete"""
+        tasks = [synthesize_chunk(i, chunk) for i, chunk in enumerate(all_chunks)]
+        for completed in asyncio.as_completed(tasks):
+            await queue.put(await completed)
+        await queue.put(None)  # Signal completion
+
+    async def consumer():
+        """Write chunk files to disk as they come off the queue"""
+        written = 0
+
+        while True:
+            item = await queue.get()
+            if item is None:
+                break
+
+            index, response = item
+            if response.error:
+                print(f"❌ TTS error: {response.error}")
+                return False
+
+            async with aiofiles.open(chunk_dir / f"chunk_{index:04d}.mp3", 'wb') as f:
+                await f.write(response.audio_data)
+
+            written += 1
+            print(f"   Synthesized chunk {written}/{len(all_chunks)}")
+
+        return True
+
+    producer_task = asyncio.create_task(producer())
+    synthesized = await consumer()
+
+    if not synthesized:
+        producer_task.cancel()
+        return
+
+    await producer_task
+
     print("✅ Speech synthesis complete")
-    
-    # Combine audio
-    print("\n🔗 Combining audio chunks...")
-    combined_audio = audio_processor.combine_audio_chunks(
-        audio_chunks,
-        chapter_pause_duration=1.0  # Shorter pause for demo
-    )
-    
-    print("✅ Audio combination complete")
-    
-    # Export MP3
-    print("\n💾 Exporting MP3...")
+
+    # Combine and export in a single ffmpeg pass: the concat demuxer with
+    # stream copy joins the chunks without decoding and re-encoding each one
+    print("\n💾 Combining and exporting MP3...")
     output_path = "output/demo_audiobook.mp3"
-    
+
     metadata = AudioMetadata(
         title="Demo Audiobook",
         author="Podcastify Demo",
         album="Demo Collection",
         genre="Audiobook"
     )
-    
-    final_path = audio_processor.export_mp3(
-        combined_audio,
-        output_path,
-        metadata,
-        bitrate="128k"  # Lower bitrate for demo
-    )
-    
+
+    # A shared silence chunk provides the pauses between chapters
+    pause_path = chunk_dir / "pause.mp3"
+    AudioSegment.silent(
+        duration=int(chapter_pause_duration * 1000),
+        frame_rate=24000  # Matches OpenAI TTS output
+    ).export(pause_path, format="mp3")
+
+    concat_lines = []
+    for i, chunk in enumerate(all_chunks):
+        concat_lines.append(f"file 'chunk_{i:04d}.mp3'")
+        if i < len(all_chunks) - 1 and chunk.chapter != all_chunks[i + 1].chapter:
+            concat_lines.append("file 'pause.mp3'")
+
+    concat_path = chunk_dir / "concat.txt"
+    concat_path.write_text("\n".join(concat_lines) + "\n")
+
+    try:
+        subprocess.run([
+            "ffmpeg", "-y", "-f", "concat", "-safe", "0",
+            "-i", str(concat_path),
+            "-c", "copy",
+            "-metadata", f"title={metadata.title}",
+            "-metadata", f"artist={metadata.author}",
+            "-metadata", f"album={metadata.album}",
+            "-metadata", f"genre={metadata.genre}",
+            output_path
+        ], check=True, capture_output=True, text=True)
+    except subprocess.CalledProcessError as e:
+        print(f"❌ FFmpeg export failed:")
+        print(e.stderr)
+        return
+
+    final_path = output_path
     print(f"✅ Demo audiobook created: {final_path}")
     
     # Get audio info
@@ -172,14 +288,21 @@ async def demo_conversion():
     print("\n🎉 Demo complete!")
     print(f"You can play the generated file: {final_path}")
 
+async def run_demo():
+    """Run demo_conversion with a shared HTTP connection pool"""
+    async with httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=16)
+    ) as http_client:
+        await demo_conversion(http_client)
+
 def main():
     """Run the demo"""
     try:
-        # Ensure output directory exists
-        Path("output").mkdir(exist_ok=True)
-        
+        # Ensure output and cache directories exist
+        TTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
         # Run the demo
-        asyncio.run(demo_conversion())
+        asyncio.run(run_demo())
         
     except KeyboardInterrupt:
         print("\n⏹️ Demo cancelled by user")
@@ -6,6 +6,7 @@ Helps set up the application with proper dependencies and configuration
 
 import os
 import sys
+import shutil
 import subprocess
 import platform
 from pathlib import Path
@@ -40,13 +41,14 @@ def install_dependencies():
 def check_ffmpeg():
     """Check if FFmpeg is installed"""
     print("\n🎵 Checking FFmpeg installation...")
-    try:
-        subprocess.check_output(["ffmpeg", "-version"], stderr=subprocess.STDOUT)
+    # A PATH lookup is all we need; spawning ffmpeg just to discard its
+    # version output costs a process fork and binary load
+    if shutil.which("ffmpeg") is not None:
         print("✅ FFmpeg is installed")
         return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        print("❌ FFmpeg not found")
-        return False
+
+    print("❌ FFmpeg not found")
+    return False
 
 def install_ffmpeg_instructions():
     """Provide FFmpeg installation instructions"""
@@ -87,9 +89,8 @@ def setup_environment():
     env_example = Path(".env.example")
     
     if not env_file.exists() and env_example.exists():
-        # Copy example to .env
-        with open(env_example, 'r') as src, open(env_file, 'w') as dst:
-            dst.write(src.read())
+        # Copy example to .env (copyfile uses zero-copy sendfile where available)
+        shutil.copyfile(env_example, env_file)
         print("✅ Created .env file from template")
     elif env_file.exists():
         print("✅ .env file already exists")
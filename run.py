@@ -4,9 +4,21 @@ Podcastify Launcher Script
 Simple script to start the application with proper checks
 """
 
+# Eventlet must monkey-patch the stdlib before anything else is imported
+# so Flask-SocketIO can serve all clients from one greenlet hub instead
+# of one OS thread per connection
+try:
+    import eventlet
+except ImportError:
+    print("❌ Missing dependency: eventlet")
+    print("Please install dependencies: pip install -r requirements.txt")
+    raise SystemExit(1)
+eventlet.monkey_patch()
+
 import os
 import sys
 import subprocess
+import importlib.util
 from pathlib import Path
 
 def check_requirements():
@@ -26,15 +38,12 @@ def check_requirements():
         if not Path(directory).exists():
             Path(directory).mkdir(exist_ok=True)
     
-    # Try importing key modules
-    try:
-        import flask
-        import fitz
-        import pydub
-        import openai
-    except ImportError as e:
-        issues.append(f"Missing dependency: {e}")
-    
+    # Check that key modules are importable without executing them;
+    # the real imports happen when the Flask app starts
+    for module in ("flask", "fitz", "pydub", "openai"):
+        if importlib.util.find_spec(module) is None:
+            issues.append(f"Missing dependency: {module}")
+
     return issues
 
 def print_banner():